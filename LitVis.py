@@ -1,50 +1,158 @@
-import sys, csv, json, io
+import sys, os, stat, re, csv, json, io, html, gzip, tempfile, zipfile, heapq, random, multiprocessing
+from html.parser import HTMLParser
+from xml.sax.saxutils import escape as xmlEscape
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QTableWidget, QTableWidgetItem, QVBoxLayout,
     QWidget, QTabWidget, QPushButton, QHBoxLayout, QInputDialog, QMessageBox,
     QFileDialog, QDialog, QLabel, QTextEdit, QComboBox, QColorDialog,
     QListWidget, QStyledItemDelegate, QLineEdit, QToolBar, QStatusBar,
-    QUndoStack, QUndoCommand, QAction, QMenu, QToolButton
+    QUndoStack, QUndoCommand, QAction, QMenu, QToolButton, QCheckBox, QListWidgetItem
 )
-from PyQt5.QtCore import Qt, QTimer, QSignalBlocker, QSize
-from PyQt5.QtGui import QFont, QTextDocument, QAbstractTextDocumentLayout
+from PyQt5.QtCore import Qt, QTimer, QSignalBlocker, QSize, QThread, QSemaphore, QEvent, QMimeData, QPersistentModelIndex, pyqtSignal
+from PyQt5.QtGui import QFont, QFontMetrics, QTextDocument, QAbstractTextDocumentLayout, QKeySequence, QColor
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
+from PyQt5 import sip
+
+# Item data role on a row's first-column item: (collapseEpoch, collapsed) for a
+# row toggled on its own. It travels with the item, so it survives sorting.
+COLLAPSED_ROLE = Qt.UserRole + 1
+# Item data role: the keys the item added to the StatisticsDialog's counter
+STATISTICS_ROLE = Qt.UserRole + 2
+
+
+# Below this zoom factor cells are drawn as elided plain text
+LOD_ZOOM = 0.6
+# Table zoom range and the factor of one zoom step
+MIN_ZOOM = 0.3
+MAX_ZOOM = 3.0
+ZOOM_STEP = 1.2
+# Column auto-fit sample: first rows, longest values and random rows per
+# column, then more random rows measured in idle time. Widths are capped.
+AUTOFIT_FIRST_ROWS = 50
+AUTOFIT_LONGEST_ROWS = 20
+AUTOFIT_RANDOM_ROWS = 30
+AUTOFIT_REFINE_ROWS = 2000
+AUTOFIT_REFINE_CHUNK = 100
+AUTOFIT_MAX_WIDTH = 400
+# Number of laid-out documents / plain-text previews kept by the delegate
+DOCUMENT_CACHE_SIZE = 2000
+
 
 # ---------------------
 # RichTextDelegate:
 # Renders HTML in cells and applies conditional formatting rules.
+# Collapsed rows, low zoom levels and fast scrolling use a cheap one-line
+# elided plain-text preview instead of the full rich-text layout.
+# Zooming only scales the painter: documents are laid out at the unzoomed
+# width and cached, so a zoom step does not re-layout every cell.
 # ---------------------
 class RichTextDelegate(QStyledItemDelegate):
     def __init__(self, parent=None, rules=None):
         super().__init__(parent)
         self.rules = rules if rules is not None else {}
         self.defaultFont = QFont()  # Will be updated via updateDefaultFont
+        self.zoomFactor = 1.0
+        self.fastScrolling = False  # set by MainWindow while the view scrolls quickly
+        self.allCollapsed = False  # table-wide state of Collapse All / Expand All
+        self.collapseEpoch = 0  # bumped by Collapse All / Expand All; older row states are stale
+        self.documentCache = OrderedDict()  # (html, width) -> QTextDocument
+        self.plainCache = OrderedDict()  # html -> first line of plain text
+        self.widthCache = OrderedDict()  # html -> unwrapped width (see contentWidth)
 
     def updateDefaultFont(self, newFont):
         self.defaultFont = newFont
+        self.documentCache.clear()
+        self.widthCache.clear()
+
+    def rowCollapseState(self, index):
+        """The row's own collapsed flag, or None if it follows the table-wide state."""
+        state = index.sibling(index.row(), 0).data(COLLAPSED_ROLE)
+        if state is None or state[0] != self.collapseEpoch:
+            return None
+        return state[1]
+
+    def isCollapsed(self, index):
+        state = self.rowCollapseState(index)
+        return self.allCollapsed if state is None else state
+
+    def collapsedHeight(self):
+        return round((QFontMetrics(self.defaultFont).height() + 4) * self.zoomFactor)
+
+    def document(self, text, width):
+        key = (text, round(width))
+        doc = self.documentCache.get(key)
+        if doc is not None:
+            self.documentCache.move_to_end(key)
+            return doc
+        doc = QTextDocument()
+        doc.setHtml(text)
+        doc.setDefaultFont(self.defaultFont)
+        doc.setTextWidth(round(width))
+        self.documentCache[key] = doc
+        if len(self.documentCache) > DOCUMENT_CACHE_SIZE:
+            self.documentCache.popitem(last=False)
+        return doc
+
+    def previewText(self, text):
+        firstLine = self.plainCache.get(text)
+        if firstLine is None:
+            # Regex split instead of a QTextDocument: this path has to stay cheap
+            firstLine = htmlFirstLine(text)
+            self.plainCache[text] = firstLine
+            if len(self.plainCache) > DOCUMENT_CACHE_SIZE:
+                self.plainCache.popitem(last=False)
+        return firstLine
+
+    def paintPreview(self, painter, option, index):
+        firstLine = self.previewText(index.data() or "")
+        rect = option.rect.adjusted(2, 0, -2, 0)
+        font = QFont(self.defaultFont)
+        if font.pointSizeF() > 0:
+            font.setPointSizeF(font.pointSizeF() * self.zoomFactor)
+        painter.save()
+        painter.setFont(font)
+        elided = painter.fontMetrics().elidedText(firstLine, Qt.ElideRight, rect.width())
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignTop, elided)
+        painter.restore()
 
     def paint(self, painter, option, index):
+        if self.isCollapsed(index) or self.fastScrolling or self.zoomFactor < LOD_ZOOM:
+            self.paintPreview(painter, option, index)
+            return
         text = index.data() or ""
         # Apply conditional formatting rules:
         for word, color in self.rules.items():
             text = text.replace(word, f'<span style="color: {color};">{word}</span>')
-        doc = QTextDocument()
-        doc.setHtml(text)
-        doc.setDefaultFont(self.defaultFont)
-        doc.setTextWidth(option.rect.width())
+        doc = self.document(text, option.rect.width() / self.zoomFactor)
         painter.save()
         painter.translate(option.rect.topLeft())
+        painter.setClipRect(0, 0, option.rect.width(), option.rect.height())
+        painter.scale(self.zoomFactor, self.zoomFactor)
         context = QAbstractTextDocumentLayout.PaintContext()
         doc.documentLayout().draw(painter, context)
         painter.restore()
 
+    def contentWidth(self, text):
+        """Unwrapped width of a cell at zoom 1.0, cached per cell text."""
+        width = self.widthCache.get(text)
+        if width is None:
+            doc = QTextDocument()
+            doc.setHtml(text)
+            doc.setDefaultFont(self.defaultFont)
+            width = doc.size().width()
+            self.widthCache[text] = width
+            if len(self.widthCache) > DOCUMENT_CACHE_SIZE * 10:
+                self.widthCache.popitem(last=False)
+        return width
+
     def sizeHint(self, option, index):
+        if self.isCollapsed(index):
+            return QSize(option.rect.width(), self.collapsedHeight())
         text = index.data() or ""
-        doc = QTextDocument()
-        doc.setHtml(text)
-        doc.setDefaultFont(self.defaultFont)
-        doc.setTextWidth(option.rect.width())
-        return doc.size().toSize()
+        size = self.document(text, option.rect.width() / self.zoomFactor).size() * self.zoomFactor
+        return size.toSize()
 
 
 
@@ -291,6 +399,418 @@ class AdvancedFilterDialog(QDialog):
         return {"combine": self.combineCombo.currentText(), "conditions": self.conditions}
 
 
+# ---------------------
+# FindReplaceDialog:
+# Non-modal panel to find and replace plain text (optionally regex) in all
+# cells or in the selected columns. Matches are collected once into a list of
+# items (which stay valid when rows are sorted) and find-next walks that list.
+# ---------------------
+class FindReplaceDialog(QDialog):
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Find/Replace")
+        self.resize(450, 150)
+        self.table = table
+        self.matches = None  # list of QTableWidgetItems, built on demand
+        self.matchPos = -1
+        mainLayout = QVBoxLayout(self)
+
+        findLayout = QHBoxLayout()
+        self.findField = QLineEdit(self)
+        self.replaceField = QLineEdit(self)
+        findLayout.addWidget(QLabel("Find:", self))
+        findLayout.addWidget(self.findField)
+        findLayout.addWidget(QLabel("Replace with:", self))
+        findLayout.addWidget(self.replaceField)
+        mainLayout.addLayout(findLayout)
+
+        optionsLayout = QHBoxLayout()
+        self.regexCheck = QCheckBox("Regular expression", self)
+        self.caseCheck = QCheckBox("Match case", self)
+        self.scopeCombo = QComboBox(self)
+        self.scopeCombo.addItems(["All columns", "Selected columns"])
+        optionsLayout.addWidget(self.regexCheck)
+        optionsLayout.addWidget(self.caseCheck)
+        optionsLayout.addWidget(self.scopeCombo)
+        mainLayout.addLayout(optionsLayout)
+
+        self.infoLabel = QLabel("", self)
+        mainLayout.addWidget(self.infoLabel)
+
+        btnLayout = QHBoxLayout()
+        findNextBtn = QPushButton("Find Next", self)
+        replaceAllBtn = QPushButton("Replace All", self)
+        closeBtn = QPushButton("Close", self)
+        btnLayout.addWidget(findNextBtn)
+        btnLayout.addWidget(replaceAllBtn)
+        btnLayout.addWidget(closeBtn)
+        mainLayout.addLayout(btnLayout)
+        findNextBtn.clicked.connect(self.findNext)
+        replaceAllBtn.clicked.connect(self.replaceAll)
+        closeBtn.clicked.connect(self.close)
+
+        # Any change of the search invalidates the match list
+        self.findField.textChanged.connect(self.resetMatches)
+        self.regexCheck.toggled.connect(self.resetMatches)
+        self.caseCheck.toggled.connect(self.resetMatches)
+        self.scopeCombo.currentIndexChanged.connect(self.resetMatches)
+        # Listen on the model: batched updates (paste, import, merge, diff)
+        # block the table's itemChanged but not dataChanged. Removing
+        # rows/columns or resetting the table deletes the matched items.
+        model = self.table.model()
+        for signal in (model.dataChanged, model.rowsRemoved, model.columnsRemoved, model.modelReset):
+            signal.connect(self.resetMatches)
+
+    def resetMatches(self, *args):
+        self.matches = None
+        self.matchPos = -1
+
+    def searchPattern(self):
+        text = self.findField.text()
+        if not text:
+            return None
+        flags = 0 if self.caseCheck.isChecked() else re.IGNORECASE
+        try:
+            return re.compile(text if self.regexCheck.isChecked() else re.escape(text), flags)
+        except re.error as e:
+            QMessageBox.warning(self, "Find/Replace", f"Invalid regular expression:\n{e}")
+            return None
+
+    def searchColumns(self):
+        if self.scopeCombo.currentText() == "Selected columns":
+            return sorted({index.column() for index in self.table.selectedIndexes()})
+        return range(self.table.columnCount())
+
+    def collectMatches(self, pattern):
+        matches = []
+        columns = self.searchColumns()
+        for row in range(self.table.rowCount()):
+            for col in columns:
+                item = self.table.item(row, col)
+                if item is not None and pattern.search(htmlTextContent(item.text())):
+                    matches.append(item)
+        return matches
+
+    def findNext(self):
+        pattern = self.searchPattern()
+        if pattern is None:
+            return
+        if self.matches is None:
+            self.matches = self.collectMatches(pattern)
+            self.matchPos = -1
+        if not self.matches:
+            self.infoLabel.setText("No matches.")
+            return
+        self.matchPos = (self.matchPos + 1) % len(self.matches)
+        item = self.matches[self.matchPos]
+        if sip.isdeleted(item):
+            # Deleted behind our back (e.g. signals were blocked): search again
+            self.resetMatches()
+            self.findNext()
+            return
+        self.table.setCurrentItem(item)
+        self.table.scrollToItem(item)
+        self.infoLabel.setText(f"Match {self.matchPos + 1} of {len(self.matches)}")
+
+    def replaceAll(self):
+        pattern = self.searchPattern()
+        if pattern is None:
+            return
+        replacement = self.replaceField.text()
+        if not self.regexCheck.isChecked():
+            replacement = replacement.replace("\\", "\\\\")  # literal text, no group references
+
+        # One batched update: no sorting, no per-cell signals, rows resized once
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        blocker = QSignalBlocker(self.table)
+        changedItems = []
+        total = 0
+        skipped = 0  # found in the cell text, but spanning formatting tags
+        try:
+            for col in self.searchColumns():
+                for row in range(self.table.rowCount()):
+                    item = self.table.item(row, col)
+                    if item is None:
+                        continue
+                    cellHtml = item.text()
+                    newHtml, count = replaceInHtml(cellHtml, pattern, replacement)
+                    skipped += max(len(pattern.findall(htmlTextContent(cellHtml))) - count, 0)
+                    if count:
+                        item.setText(newHtml)
+                        changedItems.append(item)
+                        total += count
+        finally:
+            blocker.unblock()
+            self.table.setSortingEnabled(sorting)
+        # Re-enabling sorting may have moved the rows
+        changedRows = {self.table.row(item) for item in changedItems}
+        for row in changedRows:
+            self.table.resizeRowToContents(row)
+        self.resetMatches()
+        message = f"Replaced {total} occurrences in {len(changedRows)} rows."
+        if skipped:
+            message += f" {skipped} matches span formatting and were left unchanged."
+        self.infoLabel.setText(message)
+
+
+# ---------------------
+# Helpers: Column statistics
+# Each cell contributes a list of keys to a Counter; keeping the keys per
+# item lets an edited cell be swapped out without recounting the column.
+# ---------------------
+STATISTICS_MODES = ["Value counts", "Year histogram", "Keyword frequencies", "Empty cells"]
+YEAR_RE = re.compile(r"\b(1[5-9]\d\d|20\d\d)\b")
+
+
+def statisticKeys(mode, text, delimiters=";,"):
+    text = text.strip()
+    if not text:
+        return []
+    if mode == "Value counts":
+        return [text]
+    if mode == "Year histogram":
+        match = YEAR_RE.search(text)
+        return [match.group(1)] if match else []
+    if mode == "Keyword frequencies":
+        parts = re.split(f"[{re.escape(delimiters)}]", text) if delimiters else [text]
+        return [part.strip().lower() for part in parts if part.strip()]
+    return []
+
+
+# ---------------------
+# StatisticsDialog:
+# Non-modal panel with value counts, year histograms, keyword frequencies and
+# empty-cell counts over the visible (not filtered) rows. Edits are applied
+# incrementally; row/column changes and filtering trigger a recount.
+# ---------------------
+class StatisticsDialog(QDialog):
+    def __init__(self, table, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Statistics")
+        self.resize(450, 500)
+        self.table = table
+        self.counter = Counter()
+        self.visibleCount = 0
+        mainLayout = QVBoxLayout(self)
+
+        formLayout = QHBoxLayout()
+        self.columnCombo = QComboBox(self)
+        self.modeCombo = QComboBox(self)
+        self.modeCombo.addItems(STATISTICS_MODES)
+        self.delimiterField = QLineEdit(";,", self)
+        self.delimiterField.setMaximumWidth(50)
+        formLayout.addWidget(QLabel("Column:", self))
+        formLayout.addWidget(self.columnCombo)
+        formLayout.addWidget(self.modeCombo)
+        formLayout.addWidget(QLabel("Delimiters:", self))
+        formLayout.addWidget(self.delimiterField)
+        mainLayout.addLayout(formLayout)
+
+        self.infoLabel = QLabel("", self)
+        mainLayout.addWidget(self.infoLabel)
+        self.listWidget = QListWidget(self)
+        mainLayout.addWidget(self.listWidget)
+
+        btnLayout = QHBoxLayout()
+        refreshBtn = QPushButton("Refresh", self)
+        closeBtn = QPushButton("Close", self)
+        btnLayout.addWidget(refreshBtn)
+        btnLayout.addWidget(closeBtn)
+        mainLayout.addLayout(btnLayout)
+        refreshBtn.clicked.connect(self.recompute)
+        closeBtn.clicked.connect(self.close)
+
+        # Bursts of edits/structure changes are coalesced by these timers
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setSingleShot(True)
+        self.refreshTimer.setInterval(200)
+        self.refreshTimer.timeout.connect(self.refreshView)
+        self.recomputeTimer = QTimer(self)
+        self.recomputeTimer.setSingleShot(True)
+        self.recomputeTimer.setInterval(200)
+        self.recomputeTimer.timeout.connect(self.recompute)
+
+        self.columnCombo.currentIndexChanged.connect(self.scheduleRecompute)
+        self.modeCombo.currentIndexChanged.connect(self.scheduleRecompute)
+        self.delimiterField.textChanged.connect(self.scheduleRecompute)
+        # The model's dataChanged also fires during batched updates that block
+        # the table's own cellChanged/itemChanged signals
+        model = self.table.model()
+        model.dataChanged.connect(self.onDataChanged)
+        for signal in (model.rowsInserted, model.rowsRemoved, model.columnsInserted,
+                       model.columnsRemoved, model.modelReset):
+            signal.connect(self.scheduleRecompute)
+        model.headerDataChanged.connect(self.scheduleRecompute)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.recompute()
+
+    def scheduleRecompute(self, *args):
+        if self.isVisible():
+            self.recomputeTimer.start()
+
+    def fillColumns(self):
+        current = self.columnCombo.currentIndex()
+        headers = []
+        for col in range(self.table.columnCount()):
+            header_item = self.table.horizontalHeaderItem(col)
+            headers.append(header_item.text() if header_item else f"Column {col + 1}")
+        blocker = QSignalBlocker(self.columnCombo)
+        self.columnCombo.clear()
+        self.columnCombo.addItems(headers)
+        if 0 <= current < len(headers):
+            self.columnCombo.setCurrentIndex(current)
+        blocker.unblock()
+
+    def itemKeys(self, item):
+        text = htmlTextContent(item.text())
+        mode = self.modeCombo.currentText()
+        if mode == "Empty cells":
+            # Count filled cells per column; empty = visible rows - filled
+            return [item.column()] if text.strip() else []
+        return statisticKeys(mode, text, self.delimiterField.text())
+
+    def statisticColumns(self):
+        if self.modeCombo.currentText() == "Empty cells":
+            return range(self.table.columnCount())
+        col = self.columnCombo.currentIndex()
+        return [col] if col >= 0 else []
+
+    def recompute(self):
+        self.recomputeTimer.stop()
+        self.fillColumns()
+        visibleRows = [row for row in range(self.table.rowCount()) if not self.table.isRowHidden(row)]
+        self.visibleCount = len(visibleRows)
+        keyLists = []
+        # The keys are stored on the items (sip wrappers of C++-created items
+        # are temporary, so their id() is no key). Blocking the model keeps
+        # this from looking like an edit.
+        blocker = QSignalBlocker(self.table.model())
+        try:
+            for col in self.statisticColumns():
+                for row in visibleRows:
+                    item = self.table.item(row, col)
+                    if item is None:
+                        continue
+                    keys = self.itemKeys(item)
+                    item.setData(STATISTICS_ROLE, keys)
+                    keyLists.append(keys)
+        finally:
+            blocker.unblock()
+        self.counter = Counter(key for keys in keyLists for key in keys)
+        self.refreshView()
+
+    def onDataChanged(self, topLeft, bottomRight, roles=None):
+        if not self.isVisible() or self.recomputeTimer.isActive():
+            return
+        if roles and Qt.DisplayRole not in roles:
+            return
+        if topLeft != bottomRight:
+            self.scheduleRecompute()
+            return
+        item = self.table.item(topLeft.row(), topLeft.column())
+        if item is None or item.column() not in self.statisticColumns() or self.table.isRowHidden(item.row()):
+            return
+        oldKeys = item.data(STATISTICS_ROLE) or []
+        newKeys = self.itemKeys(item)
+        if oldKeys == newKeys:
+            return
+        self.counter.subtract(oldKeys)
+        self.counter.update(newKeys)
+        blocker = QSignalBlocker(self.table.model())
+        item.setData(STATISTICS_ROLE, newKeys)
+        blocker.unblock()
+        self.refreshTimer.start()
+
+    def refreshView(self):
+        mode = self.modeCombo.currentText()
+        self.listWidget.clear()
+        counts = {key: count for key, count in self.counter.items() if count > 0}
+        if mode == "Empty cells":
+            for col in range(self.table.columnCount()):
+                empty = self.visibleCount - counts.get(col, 0)
+                self.listWidget.addItem(f"{self.columnCombo.itemText(col)}: {empty} empty")
+            self.infoLabel.setText(f"{self.visibleCount} visible rows")
+            return
+        if mode == "Year histogram":
+            entries = sorted(counts.items())
+        else:
+            entries = sorted(counts.items(), key=lambda entry: (-entry[1], entry[0]))[:500]
+        maxCount = max(counts.values(), default=0)
+        for key, count in entries:
+            if mode == "Year histogram":
+                bar = "\u2588" * max(1, round(30 * count / maxCount))
+                self.listWidget.addItem(f"{key}  {bar} {count}")
+            else:
+                self.listWidget.addItem(f"{count:>6}  {key}")
+        self.infoLabel.setText(f"{len(counts)} distinct values in {self.visibleCount} visible rows")
+
+
+# ---------------------
+# ProjectDiffDialog:
+# Lists the rows that differ between the open table and another project
+# version. Checked changes are applied to the table in one batch.
+# ---------------------
+class ProjectDiffDialog(QDialog):
+    def __init__(self, headers, rows, otherRows, changes, cellKey=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Compare Projects")
+        self.resize(650, 450)
+        self.changes = changes
+        mainLayout = QVBoxLayout(self)
+
+        added = sum(1 for kind, _, _ in changes if kind == "added")
+        removed = sum(1 for kind, _, _ in changes if kind == "removed")
+        mainLayout.addWidget(QLabel(
+            f"{added} rows only in file, {removed} rows only in table, "
+            f"{len(changes) - added - removed} modified rows.\n"
+            "Checked changes make the table match the file.", self))
+
+        self.listWidget = QListWidget(self)
+        for kind, row, otherRow in changes:
+            if kind == "added":
+                text = f"+ Only in file: {self.preview(otherRows[otherRow])}"
+            elif kind == "removed":
+                text = f"- Only in table: {self.preview(rows[row])}"
+            else:
+                key = cellKey or (lambda cell: cell)
+                changed = [headers[col] for col in range(len(headers))
+                           if key(rows[row][col]) != key(otherRows[otherRow][col])]
+                text = f"~ Modified ({', '.join(changed)}): {self.preview(rows[row])}"
+            item = QListWidgetItem(text, self.listWidget)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+        mainLayout.addWidget(self.listWidget)
+
+        btnLayout = QHBoxLayout()
+        selectAllBtn = QPushButton("Select All", self)
+        applyBtn = QPushButton("Apply Selected", self)
+        cancelBtn = QPushButton("Cancel", self)
+        btnLayout.addWidget(selectAllBtn)
+        btnLayout.addWidget(applyBtn)
+        btnLayout.addWidget(cancelBtn)
+        mainLayout.addLayout(btnLayout)
+        selectAllBtn.clicked.connect(self.selectAll)
+        applyBtn.clicked.connect(self.accept)
+        cancelBtn.clicked.connect(self.reject)
+
+    @staticmethod
+    def preview(rowData):
+        texts = (htmlTextContent(cell).strip() for cell in rowData)
+        text = next((text for text in texts if text), "")
+        return text if len(text) <= 80 else text[:77] + "..."
+
+    def selectAll(self):
+        for i in range(self.listWidget.count()):
+            self.listWidget.item(i).setCheckState(Qt.Checked)
+
+    def getSelectedChanges(self):
+        return [change for i, change in enumerate(self.changes)
+                if self.listWidget.item(i).checkState() == Qt.Checked]
+
+
 # ---------------------
 # Helper: Convert HTML to plain text (for CSV export)
 # ---------------------
@@ -317,6 +837,811 @@ def checkCondition(cellText, operator, value):
     return False
 
 
+# ---------------------
+# Helpers: Text nodes of cell HTML (for find/replace)
+# Splitting on tags is much cheaper than a QTextDocument per cell and lets
+# replacements touch only the text between tags, so the markup survives.
+# ---------------------
+HTML_TAG_RE = re.compile(r"(<[^>]*>)")
+HTML_SKIP_TAGS = ("head", "style", "script")
+
+
+def htmlTextParts(cellHtml):
+    """Returns the re.split parts of cellHtml (tags at odd positions) and the
+    indices of the parts that are visible text nodes."""
+    parts = HTML_TAG_RE.split(cellHtml)
+    textIndices = []
+    skip = False
+    for i, part in enumerate(parts):
+        if i % 2:
+            name = part[1:-1].strip().lstrip("/").split(" ")[0].lower()
+            if name in HTML_SKIP_TAGS:
+                skip = not part.startswith("</")
+        elif part and not skip:
+            textIndices.append(i)
+    return parts, textIndices
+
+
+def htmlTextContent(cellHtml):
+    parts, textIndices = htmlTextParts(cellHtml)
+    return "".join(html.unescape(parts[i]) for i in textIndices)
+
+
+HTML_BODY_RE = re.compile(r"<body[^>]*>(.*)</body>", re.DOTALL | re.IGNORECASE)
+
+
+def htmlBodyFragment(cellHtml):
+    """Strips the <html>/<head> wrapper that QTextEdit.toHtml() adds."""
+    match = HTML_BODY_RE.search(cellHtml)
+    return match.group(1).strip() if match else cellHtml
+
+
+def plainToCellHtml(text):
+    return html.escape(text, quote=False).replace("\r\n", "\n").replace("\n", "<br>")
+
+
+HTML_LINE_BREAK_RE = re.compile(r"<(?:br|/p|/div|/li|/h[1-6]|/tr)\b[^>]*>", re.IGNORECASE)
+
+
+def htmlFirstLine(cellHtml):
+    """First non-empty line of the visible text, for one-line previews."""
+    text = htmlTextContent(HTML_LINE_BREAK_RE.sub("\n", cellHtml))
+    return next((line.strip() for line in text.splitlines() if line.strip()), "")
+
+
+HTML_SPACE_RE = re.compile(r"[ \t\r\n\f]+")
+
+
+def htmlPlainText(cellHtml):
+    """Visible text as it is displayed: whitespace runs (including the
+    newlines of toHtml() formatting) become one space, line and block breaks
+    become newlines."""
+    text = htmlTextContent(HTML_LINE_BREAK_RE.sub("\0", cellHtml))
+    lines = (HTML_SPACE_RE.sub(" ", line).strip() for line in text.split("\0"))
+    return "\n".join(lines).strip("\n")
+
+
+def replaceInHtml(cellHtml, pattern, replacement):
+    """Applies pattern.subn to every text node. Returns (newHtml, count)."""
+    parts, textIndices = htmlTextParts(cellHtml)
+    total = 0
+    for i in textIndices:
+        newText, count = pattern.subn(replacement, html.unescape(parts[i]))
+        if count:
+            parts[i] = html.escape(newText, quote=False)
+            total += count
+    return "".join(parts), total
+
+
+# ---------------------
+# Helpers: Streaming BibTeX / RIS parsing
+# Both parsers read the file line by line and yield one dict per entry
+# ({LitVis column name: plain text}), so only one entry is held at a time.
+# ---------------------
+BIBTEX_FIELD_MAP = {
+    "title": "Title",
+    "author": "Author",
+    "editor": "Editor",
+    "year": "Year",
+    "journal": "Journal",
+    "booktitle": "Journal",
+    "keywords": "Keywords",
+    "abstract": "Abstract",
+    "doi": "DOI",
+    "url": "URL",
+    "volume": "Volume",
+    "number": "Issue",
+    "pages": "Pages",
+    "publisher": "Publisher",
+    "note": "Comments",
+    "annote": "Comments",
+}
+
+RIS_TAG_MAP = {
+    "TI": "Title", "T1": "Title",
+    "AU": "Author", "A1": "Author",
+    "ED": "Editor", "A2": "Editor",
+    "PY": "Year", "Y1": "Year",
+    "JO": "Journal", "JF": "Journal", "T2": "Journal",
+    "KW": "Keywords",
+    "AB": "Abstract", "N2": "Abstract",
+    "DO": "DOI",
+    "UR": "URL",
+    "VL": "Volume",
+    "IS": "Issue",
+    "SP": "Start Page", "EP": "End Page",
+    "PB": "Publisher",
+    "N1": "Comments",
+    "ID": "Citation Key",
+}
+
+# Tags/fields that may occur several times and are joined with "; "
+MULTI_VALUE_COLUMNS = {"Author", "Editor", "Keywords"}
+
+# An entry starts with "@type{" or "@type(" - a bare "@" (e.g. an e-mail
+# address in a comment between entries) does not start one
+BIBTEX_ENTRY_START_RE = re.compile(r"@\s*[A-Za-z][\w-]*\s*[{(]")
+BIBTEX_DELIMITER_RES = {"{": re.compile(r"[{}]"), "(": re.compile(r"[()]")}
+
+LATEX_ESCAPES = [("\\&", "&"), ("\\%", "%"), ("\\_", "_"), ("\\$", "$"), ("\\#", "#"), ("~", " ")]
+
+
+def cleanBibtexValue(value):
+    for latex, plain in LATEX_ESCAPES:
+        value = value.replace(latex, plain)
+    value = value.replace("{", "").replace("}", "")
+    return " ".join(value.split())
+
+
+def splitBibtexValue(body, pos, strings):
+    """Reads one (possibly '#'-concatenated) field value starting at pos.
+    Returns (value, newPos)."""
+    parts = []
+    length = len(body)
+    while pos < length:
+        while pos < length and body[pos].isspace():
+            pos += 1
+        if pos >= length:
+            break
+        ch = body[pos]
+        if ch == "{":
+            depth, start = 0, pos
+            while pos < length:
+                if body[pos] == "{":
+                    depth += 1
+                elif body[pos] == "}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                pos += 1
+            parts.append(body[start + 1:pos])
+            pos += 1
+        elif ch == '"':
+            depth, start = 0, pos + 1
+            pos += 1
+            while pos < length and not (body[pos] == '"' and depth == 0):
+                if body[pos] == "{":
+                    depth += 1
+                elif body[pos] == "}":
+                    depth -= 1
+                pos += 1
+            parts.append(body[start:pos])
+            pos += 1
+        else:
+            start = pos
+            while pos < length and body[pos] not in ",#" and not body[pos].isspace():
+                pos += 1
+            token = body[start:pos]
+            parts.append(strings.get(token.lower(), token))
+        while pos < length and body[pos].isspace():
+            pos += 1
+        if pos < length and body[pos] == "#":
+            pos += 1
+            continue
+        break
+    return "".join(parts), pos
+
+
+def parseBibtexFields(body, strings):
+    """Parses 'name = value, name = value' into a list of (name, raw value)."""
+    fields = []
+    pos, length = 0, len(body)
+    while pos < length:
+        eq = body.find("=", pos)
+        if eq < 0:
+            break
+        name = body[pos:eq].strip().strip(",").strip().lower()
+        value, pos = splitBibtexValue(body, eq + 1, strings)
+        if name:
+            fields.append((name, value))
+        comma = body.find(",", pos)
+        if comma < 0:
+            break
+        pos = comma + 1
+    return fields
+
+
+def parseBibtexEntry(raw, strings):
+    """Turns one complete '@type{...}' text into an entry dict. @string
+    definitions are stored in strings; returns None for non-entries."""
+    openPos = BIBTEX_ENTRY_START_RE.match(raw).end() - 1
+    entryType = raw[1:openPos].strip().lower()
+    body = raw[openPos + 1:-1]
+
+    if entryType in ("comment", "preamble"):
+        return None
+    if entryType == "string":
+        for name, value in parseBibtexFields(body, strings):
+            strings[name] = value
+        return None
+
+    key, _, rest = body.partition(",")
+    entry = {"Citation Key": key.strip()} if key.strip() else {}
+    for name, value in parseBibtexFields(rest, strings):
+        column = BIBTEX_FIELD_MAP.get(name, name.capitalize())
+        value = cleanBibtexValue(value)
+        if name in ("author", "editor"):
+            value = "; ".join(a.strip() for a in value.split(" and ") if a.strip())
+        if not value:
+            continue
+        if column in entry and column in MULTI_VALUE_COLUMNS:
+            entry[column] += "; " + value
+        else:
+            entry.setdefault(column, value)
+    return entry
+
+
+def iterBibtexEntries(lines):
+    strings = {}
+    buffer = []
+    delimiters = None
+    depth = 0
+    for line in lines:
+        # A line can hold the end of one entry and the start of the next
+        while line:
+            if not buffer:
+                match = BIBTEX_ENTRY_START_RE.search(line)
+                if match is None:
+                    break
+                line = line[match.start():]
+                # The delimiter is either {...} or (...); only that pair is counted
+                delimiters = BIBTEX_DELIMITER_RES[line[match.end() - match.start() - 1]]
+                depth = 0
+            end = None
+            for delimiter in delimiters.finditer(line):
+                depth += 1 if delimiter.group() in "{(" else -1
+                if depth == 0:
+                    end = delimiter.end()
+                    break
+            if end is None:
+                buffer.append(line)
+                break
+            buffer.append(line[:end])
+            line = line[end:]
+            raw = "".join(buffer)
+            buffer = []
+            entry = parseBibtexEntry(raw, strings)
+            if entry is not None:
+                yield entry
+
+
+def iterRisEntries(lines):
+    entry = {}
+    lastColumn = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if len(line) >= 5 and line[2:5] == "  -" and line[:2].isalnum():
+            tag = line[:2]
+            value = line[5:].strip()
+            lastColumn = None
+            if tag == "ER":
+                if entry:
+                    yield entry
+                entry = {}
+                continue
+            if tag == "TY" or not value:
+                continue
+            column = RIS_TAG_MAP.get(tag, tag)
+            if column == "Year":
+                value = value.split("/")[0]
+            if column in entry:
+                if column in MULTI_VALUE_COLUMNS:
+                    entry[column] += "; " + value
+            else:
+                entry[column] = value
+            lastColumn = column
+        elif lastColumn and line.strip():
+            # Continuation line of a wrapped value (e.g. long abstracts)
+            entry[lastColumn] += " " + line.strip()
+    if entry:
+        yield entry
+
+
+# ---------------------
+# BibImportWorker:
+# Parses a BibTeX or RIS file in a background thread and hands the entries
+# to the GUI in batches. The semaphore keeps at most two batches in flight,
+# so memory stays constant no matter how large the export is.
+# ---------------------
+class BibImportWorker(QThread):
+    batchReady = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filePath, fileFormat, batchSize=500, parent=None):
+        super().__init__(parent)
+        self.filePath = filePath
+        self.fileFormat = fileFormat
+        self.batchSize = batchSize
+        self.pending = QSemaphore(2)
+
+    def run(self):
+        try:
+            with open(self.filePath, "r", encoding="utf-8-sig", errors="replace") as f:
+                parser = iterRisEntries if self.fileFormat == "ris" else iterBibtexEntries
+                batch = []
+                for entry in parser(f):
+                    batch.append(entry)
+                    if len(batch) >= self.batchSize:
+                        if not self.emitBatch(batch):
+                            return
+                        batch = []
+                if batch:
+                    self.emitBatch(batch)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def emitBatch(self, batch):
+        # Wait until the GUI has consumed an earlier batch (see batchDone)
+        while not self.pending.tryAcquire(1, 100):
+            if self.isInterruptionRequested():
+                return False
+        if self.isInterruptionRequested():
+            return False
+        self.batchReady.emit(batch)
+        return True
+
+    def batchDone(self):
+        self.pending.release()
+
+
+# ---------------------
+# Helpers: Project file reading/writing
+# Project files are JSON, either indented (older files), compact, or
+# gzip-compressed compact JSON; readProjectData accepts all of them.
+# ---------------------
+def readProjectData(filePath):
+    with open(filePath, "rb") as f:
+        data = f.read()
+    if data[:2] == b"\x1f\x8b":  # gzip magic number
+        data = gzip.decompress(data)
+    return json.loads(data.decode("utf-8"))
+
+
+# Process umask, read once at startup: os.umask can only be queried by
+# setting it, which is not safe to do from the save threads
+FILE_UMASK = os.umask(0)
+os.umask(FILE_UMASK)
+
+
+def writeProjectData(filePath, projectData):
+    """Writes compact JSON (gzip-compressed for *.gz paths) to a temporary
+    file next to filePath and renames it, so a crash never leaves a
+    half-written project behind."""
+    data = json.dumps(projectData, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if filePath.lower().endswith(".gz"):
+        data = gzip.compress(data, compresslevel=6)
+    directory = os.path.dirname(os.path.abspath(filePath))
+    # mkstemp creates the file as 0600; keep the mode of the file being
+    # replaced, or use the mode a normally created file would get
+    try:
+        mode = stat.S_IMODE(os.stat(filePath).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~FILE_UMASK
+    fd, tmpPath = tempfile.mkstemp(prefix=".litvis-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmpPath, mode)
+        os.replace(tmpPath, filePath)
+    except BaseException:
+        os.remove(tmpPath)
+        raise
+
+
+# ---------------------
+# Helper: Read a project (.json) or CSV file into (headers, rows, rules).
+# Runs in worker processes, so it must not touch any Qt objects.
+# ---------------------
+def readTableFile(filePath):
+    if filePath.lower().endswith(".csv"):
+        with open(filePath, "r", newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.reader(f, delimiter=";", quotechar='"'))
+        if not rows:
+            return [], [], {}
+        return rows[0], rows[1:], {}
+    projectData = readProjectData(filePath)
+    return projectData.get("headers", []), projectData.get("rows", []), projectData.get("rules", {})
+
+
+# ---------------------
+# Helper: Diff two tables by row content
+# Rows are compared as hashable tuples aligned to a common header list, so
+# sorting does not matter. Unchanged rows are paired via a dict of row tuples;
+# the rest are paired through an index of (column, cell) values.
+# ---------------------
+DIFF_MAX_POSTING = 20  # cell values shared by more rows are not used for pairing
+
+
+def htmlComparableText(cellHtml):
+    """Visible text with whitespace collapsed, so an HTML cell and its plain
+    text (e.g. from a CSV file) compare equal."""
+    return " ".join(htmlTextContent(HTML_LINE_BREAK_RE.sub("\n", cellHtml)).split())
+
+
+def diffTableRows(headers, rows, otherHeaders, otherRows, cellKey=None):
+    """Returns (unionHeaders, alignedRows, alignedOtherRows, changes). Each
+    change is (kind, row, otherRow): "added" rows exist only in otherRows,
+    "removed" rows only in rows, and "modified" pairs share at least half of
+    the non-empty cells of the row. Cells are compared as cellKey(cell) if
+    given, as they are otherwise; the aligned rows keep the original cells."""
+    unionHeaders = list(headers)
+    otherMapping = []
+    for name in otherHeaders:
+        if name not in unionHeaders:
+            unionHeaders.append(name)
+        otherMapping.append(unionHeaders.index(name))
+    width = len(unionHeaders)
+
+    def aligned(rowData, mapping):
+        cells = [""] * width
+        for col, cell in zip(mapping, rowData):
+            cells[col] = cell
+        return tuple(cells)
+
+    baseMapping = range(len(headers))
+    baseRows = [aligned(rowData, baseMapping) for rowData in rows]
+    others = [aligned(rowData, otherMapping) for rowData in otherRows]
+    if cellKey is not None:
+        baseKeys = [tuple(map(cellKey, rowData)) for rowData in baseRows]
+        otherKeys = [tuple(map(cellKey, rowData)) for rowData in others]
+    else:
+        baseKeys, otherKeys = baseRows, others
+
+    # 1. Identical rows, wherever they are
+    pool = defaultdict(list)
+    for j, rowData in enumerate(otherKeys):
+        pool[rowData].append(j)
+    unmatched = []
+    for i, rowData in enumerate(baseKeys):
+        if pool.get(rowData):
+            pool[rowData].pop()
+        else:
+            unmatched.append(i)
+    remaining = {j for indices in pool.values() for j in indices}
+
+    # 2. Modified rows: vote for the other row sharing the most cells
+    postings = defaultdict(list)
+    for j in sorted(remaining):
+        for col, cell in enumerate(otherKeys[j]):
+            if cell:
+                postings[(col, cell)].append(j)
+    changes = []
+    for i in unmatched:
+        votes = Counter()
+        filled = 0
+        for col, cell in enumerate(baseKeys[i]):
+            if not cell:
+                continue
+            filled += 1
+            candidates = postings.get((col, cell), ())
+            if len(candidates) <= DIFF_MAX_POSTING:
+                votes.update(j for j in candidates if j in remaining)
+        best = max(votes.items(), key=lambda vote: vote[1], default=None)
+        if best is not None and best[1] * 2 >= filled:
+            remaining.discard(best[0])
+            changes.append(("modified", i, best[0]))
+        else:
+            changes.append(("removed", i, None))
+    changes.extend(("added", None, j) for j in sorted(remaining))
+    return unionHeaders, baseRows, others, changes
+
+
+# ---------------------
+# CellHtmlRuns:
+# Splits cell HTML into rich-text runs (text, (bold, italic, underline,
+# color, size)) for the XLSX export. Understands the markup RichEditDialog
+# produces (styled spans/paragraphs) as well as <b>, <i>, <u> and <font>.
+# ---------------------
+class CellHtmlRuns(HTMLParser):
+    BLOCK_TAGS = ("p", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6")
+    # Whitespace right after these tags is source formatting (toHtml() puts
+    # newlines between them), not cell text
+    STRUCTURAL_TAGS = BLOCK_TAGS + ("html", "body", "table", "tbody", "thead", "td", "th", "ul", "ol")
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = [("", {})]  # (tag, format) of the open elements
+        self.runs = []
+        self.skipDepth = 0
+        self.hasText = False
+        self.afterStructuralTag = True
+
+    def currentFormat(self):
+        fmt = {}
+        for _, tagFormat in self.stack:
+            fmt.update(tagFormat)
+        return (fmt.get("bold", False), fmt.get("italic", False), fmt.get("underline", False),
+                fmt.get("color"), fmt.get("size"))
+
+    def addText(self, text):
+        if not text:
+            return
+        fmt = self.currentFormat()
+        if self.runs and self.runs[-1][1] == fmt:
+            self.runs[-1] = (self.runs[-1][0] + text, fmt)
+        else:
+            self.runs.append((text, fmt))
+        self.hasText = True
+
+    @staticmethod
+    def colorValue(value):
+        color = QColor(value.strip())
+        return "FF" + color.name()[1:].upper() if color.isValid() else None
+
+    def styleFormat(self, style):
+        fmt = {}
+        for declaration in style.split(";"):
+            name, _, value = declaration.partition(":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "font-weight":
+                fmt["bold"] = value == "bold" or (value.isdigit() and int(value) >= 600)
+            elif name == "font-style":
+                fmt["italic"] = value in ("italic", "oblique")
+            elif name == "text-decoration":
+                fmt["underline"] = "underline" in value
+            elif name == "color":
+                fmt["color"] = self.colorValue(value)
+            elif name == "font-size" and value.endswith("pt"):
+                try:
+                    fmt["size"] = float(value[:-2])
+                except ValueError:
+                    pass
+        return fmt
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_SKIP_TAGS:
+            self.skipDepth += 1
+            return
+        self.afterStructuralTag = tag in self.STRUCTURAL_TAGS
+        if tag == "br":
+            self.addText("\n")
+            return
+        if tag in self.BLOCK_TAGS and self.hasText:
+            self.addText("\n")
+        attrs = dict(attrs)
+        fmt = self.styleFormat(attrs.get("style") or "")
+        if tag in ("b", "strong"):
+            fmt["bold"] = True
+        elif tag in ("i", "em"):
+            fmt["italic"] = True
+        elif tag == "u":
+            fmt["underline"] = True
+        elif tag == "font" and attrs.get("color"):
+            fmt["color"] = self.colorValue(attrs["color"])
+        self.stack.append((tag, fmt))
+
+    def handle_endtag(self, tag):
+        if tag in HTML_SKIP_TAGS:
+            self.skipDepth = max(self.skipDepth - 1, 0)
+            return
+        self.afterStructuralTag = tag in self.STRUCTURAL_TAGS
+        for i in range(len(self.stack) - 1, 0, -1):
+            if self.stack[i][0] == tag:
+                del self.stack[i:]
+                break
+
+    def handle_data(self, data):
+        if self.skipDepth or (self.afterStructuralTag and not data.strip()):
+            return
+        self.addText(data)
+
+
+def htmlToRuns(cellHtml):
+    parser = CellHtmlRuns()
+    parser.feed(cellHtml)
+    parser.close()
+    return parser.runs
+
+
+# ---------------------
+# Helpers: Streaming XLSX writer
+# The worksheet is written row by row into the zip entry with inline
+# strings (no shared-strings table), so memory does not grow with the
+# number of rows.
+# ---------------------
+XLSX_INVALID_CHARS_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+XLSX_MAX_CELL_LENGTH = 32767
+
+XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '</Types>'),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="LitVis" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+        'Target="styles.xml"/>'
+        '</Relationships>'),
+    # Cell styles: 0 = default, 1 = wrapped text aligned to the top, 2 = bold header
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+        '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="3"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0" applyAlignment="1">'
+        '<alignment wrapText="1" vertical="top"/></xf>'
+        '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+        '</styleSheet>'),
+}
+
+
+def xlsxColumnName(col):
+    name = ""
+    col += 1
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        name = chr(65 + remainder) + name
+    return name
+
+
+def xlsxText(text):
+    return xmlEscape(XLSX_INVALID_CHARS_RE.sub("", text))
+
+
+def xlsxRun(text, fmt):
+    bold, italic, underline, color, size = fmt
+    props = ""
+    if bold:
+        props += "<b/>"
+    if italic:
+        props += "<i/>"
+    if color:
+        props += f'<color rgb="{color}"/>'
+    if size:
+        props += f'<sz val="{size:g}"/>'
+    if underline:
+        props += "<u/>"
+    rPr = f"<rPr>{props}</rPr>" if props else ""
+    return f'<r>{rPr}<t xml:space="preserve">{xlsxText(text)}</t></r>'
+
+
+def xlsxCell(ref, cellHtml, style):
+    runs = htmlToRuns(cellHtml)
+    # Trim the cell to Excel's limit and drop leading/trailing line breaks
+    length = 0
+    trimmed = []
+    for text, fmt in runs:
+        text = text[:XLSX_MAX_CELL_LENGTH - length]
+        length += len(text)
+        if text:
+            trimmed.append((text, fmt))
+    while trimmed and not trimmed[0][0].lstrip("\n"):
+        del trimmed[0]
+    while trimmed and not trimmed[-1][0].rstrip("\n"):
+        del trimmed[-1]
+    if not trimmed:
+        return ""
+    trimmed[0] = (trimmed[0][0].lstrip("\n"), trimmed[0][1])
+    trimmed[-1] = (trimmed[-1][0].rstrip("\n"), trimmed[-1][1])
+    return f'<c r="{ref}" t="inlineStr" s="{style}"><is>{"".join(xlsxRun(text, fmt) for text, fmt in trimmed)}</is></c>'
+
+
+def writeXlsxWorkbook(filePath, headers, columnWidths, rows, hiddenColumns=()):
+    """Writes a single-sheet workbook. headers/columnWidths (in pixels) are in
+    output order; rows is an iterable of cell HTML lists in the same order."""
+    columnNames = [xlsxColumnName(col) for col in range(len(headers))]
+    with zipfile.ZipFile(filePath, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, content in XLSX_STATIC_PARTS.items():
+            zf.writestr(name, content)
+        with zf.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as raw:
+            out = io.TextIOWrapper(raw, encoding="utf-8")
+            out.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                      '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">')
+            if headers:
+                out.write("<cols>")
+                for col, width in enumerate(columnWidths):
+                    hidden = ' hidden="1"' if col in hiddenColumns else ""
+                    # Excel widths are in characters of the default font (~7 px)
+                    out.write(f'<col min="{col + 1}" max="{col + 1}" width="{max(width / 7, 1):.2f}" '
+                              f'customWidth="1"{hidden}/>')
+                out.write("</cols>")
+            out.write("<sheetData>")
+            out.write('<row r="1">' + "".join(
+                f'<c r="{columnNames[col]}1" t="inlineStr" s="2"><is><t>{xlsxText(header)}</t></is></c>'
+                for col, header in enumerate(headers)) + "</row>")
+            for rowNumber, rowData in enumerate(rows, start=2):
+                out.write(f'<row r="{rowNumber}">' + "".join(
+                    xlsxCell(f"{columnNames[col]}{rowNumber}", cellHtml, 1)
+                    for col, cellHtml in enumerate(rowData) if cellHtml) + "</row>")
+            out.write("</sheetData></worksheet>")
+            out.flush()
+            out.detach()
+
+
+# ---------------------
+# ProjectSaveWorker:
+# Serializes and writes a project snapshot in a background thread.
+# ---------------------
+class ProjectSaveWorker(QThread):
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filePath, projectData, parent=None):
+        super().__init__(parent)
+        self.filePath = filePath
+        self.projectData = projectData
+
+    def run(self):
+        try:
+            writeProjectData(self.filePath, self.projectData)
+            self.saved.emit(self.filePath)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+# ---------------------
+# ProjectMergeWorker:
+# Parses several project/CSV files in a process pool and aligns their rows
+# to one combined header list (columns matched by header name).
+# ---------------------
+class ProjectMergeWorker(QThread):
+    merged = pyqtSignal(list, list, dict)
+    failed = pyqtSignal(str)
+
+    def __init__(self, filePaths, headers, parent=None):
+        super().__init__(parent)
+        self.filePaths = filePaths
+        self.headers = headers  # headers of the current table come first
+
+    def run(self):
+        try:
+            # "spawn": forking this multi-threaded Qt process could deadlock the children
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(readTableFile, self.filePaths))
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+
+        headers = list(self.headers)
+        columnIndex = {name: col for col, name in enumerate(headers)}
+        rows, rules = [], {}
+        for fileHeaders, fileRows, fileRules in results:
+            for name in fileHeaders:
+                if name not in columnIndex:
+                    columnIndex[name] = len(headers)
+                    headers.append(name)
+            mapping = [columnIndex[name] for name in fileHeaders]
+            for fileRow in fileRows:
+                row = [""] * len(headers)
+                for col, cell in zip(mapping, fileRow):
+                    row[col] = cell
+                rows.append(row)
+            for word, color in fileRules.items():
+                rules.setdefault(word, color)
+        self.merged.emit(headers, rows, rules)
+
+
 # ---------------------
 # MainWindow:
 # Main window in an Excel-like layout.
@@ -364,15 +1689,31 @@ class MainWindow(QMainWindow):
         self.delegate = RichTextDelegate(rules={})
         self.table.setItemDelegate(self.delegate)
         self.table.myDelegate = self.delegate  # for zoom updates
+        self.collapsedRows = []  # QPersistentModelIndex of rows collapsed one by one
+        self.expandedRowsState = None  # (rowCount, zoom, default row height, header state) saved by Collapse All
+        # Unzoomed minimum section sizes; setZoom scales them with the sizes
+        self.baseMinimumSectionSizes = (self.table.horizontalHeader().minimumSectionSize(),
+                                        self.table.verticalHeader().minimumSectionSize())
+        # Per header: section -> (size set by setZoom, unzoomed size as float)
+        self.zoomBaseSizes = ({}, {})
 
         # Enable cell editing on double-click
         self.table.cellDoubleClicked.connect(self.edit_cell)
         self.table.cellChanged.connect(lambda row, col: self.table.resizeRowsToContents())
-        self.table.horizontalHeader().sectionResized.connect(lambda idx, old, new: self.table.resizeRowsToContents())
+        self.table.horizontalHeader().sectionResized.connect(self.onSectionResized)
         self.table.resizeRowsToContents()
 
-        # Dictionary for storing collapsed rows
-        self.collapsedRows = {}
+        # Running BibTeX/RIS import (see importBibliography)
+        self.importWorker = None
+        # Running project merge (see mergeProjects)
+        self.mergeWorker = None
+        # Running background saves by path, and the newest snapshot waiting
+        # for each of those paths (see startProjectSave)
+        self.saveWorkers = {}
+        self.pendingSaves = {}
+        # Find/Replace and statistics panels, created on first use
+        self.findDialog = None
+        self.statsDialog = None
 
         # Create a QTabWidget for function buttons (tabs at the top)
         self.tabWidget = QTabWidget(self)
@@ -386,7 +1727,9 @@ class MainWindow(QMainWindow):
         btnAddCol = QPushButton("+ Column", self)
         btnDeleteCol = QPushButton("- Column", self)
         btnRenameCol = QPushButton("Rename Column", self)
-        for btn in [btnAddRow, btnDeleteRow, btnAddCol, btnDeleteCol, btnRenameCol]:
+        btnCopy = QPushButton("Copy", self)
+        btnPaste = QPushButton("Paste", self)
+        for btn in [btnAddRow, btnDeleteRow, btnAddCol, btnDeleteCol, btnRenameCol, btnCopy, btnPaste]:
             layoutBasis.addWidget(btn)
         self.tabBasis.setLayout(layoutBasis)
         self.tabWidget.addTab(self.tabBasis, "Basic Functions")
@@ -396,9 +1739,14 @@ class MainWindow(QMainWindow):
         layoutProj = QHBoxLayout()
         btnExportCSV = QPushButton("Export CSV", self)
         btnImportCSV = QPushButton("Import CSV", self)
+        btnExportXLSX = QPushButton("Export XLSX", self)
         btnSaveProj = QPushButton("Save Project", self)
         btnLoadProj = QPushButton("Load Project", self)
-        for btn in [btnExportCSV, btnImportCSV, btnSaveProj, btnLoadProj]:
+        btnImportBib = QPushButton("Import BibTeX/RIS", self)
+        btnMergeProj = QPushButton("Merge Projects", self)
+        btnCompareProj = QPushButton("Compare Projects", self)
+        for btn in [btnExportCSV, btnImportCSV, btnExportXLSX, btnSaveProj, btnLoadProj, btnImportBib, btnMergeProj,
+                    btnCompareProj]:
             layoutProj.addWidget(btn)
         self.tabProj.setLayout(layoutProj)
         self.tabWidget.addTab(self.tabProj, "Project/CSV")
@@ -408,7 +1756,11 @@ class MainWindow(QMainWindow):
         layoutMore = QHBoxLayout()
         btnCF = QPushButton("Conditional Formatting", self)
         btnAdvFilter = QPushButton("Advanced Filter", self)
+        btnFind = QPushButton("Find/Replace", self)
+        btnStats = QPushButton("Statistics", self)
         btnCollapse = QPushButton("Collapse Row", self)
+        btnCollapseAll = QPushButton("Collapse All", self)
+        btnExpandAll = QPushButton("Expand All", self)
 
         # QToolButton for visibility of columns
         self.columnsButton = QToolButton(self)
@@ -418,7 +1770,7 @@ class MainWindow(QMainWindow):
 
         btnPrint = QPushButton("Print", self)
 
-        for btn in [btnCF, btnAdvFilter,  btnPrint,btnCollapse, self.columnsButton]:
+        for btn in [btnCF, btnAdvFilter, btnFind, btnStats, btnPrint,btnCollapse, btnCollapseAll, btnExpandAll, self.columnsButton]:
             layoutMore.addWidget(btn)
             btn.setMinimumSize(150, 30)  # or setFixedSize(120, 40)
         self.tabMore.setLayout(layoutMore)
@@ -430,13 +1782,59 @@ class MainWindow(QMainWindow):
         btnAddCol.clicked.connect(self.addColumn)
         btnDeleteCol.clicked.connect(self.deleteColumn)
         btnRenameCol.clicked.connect(self.renameColumn)
+        btnCopy.clicked.connect(self.copySelection)
+        btnPaste.clicked.connect(self.pasteClipboard)
+        # Ctrl+C/Ctrl+V in the table copy/paste whole ranges (see eventFilter)
+        self.table.installEventFilter(self)
+
+        # Set while zoom/auto-fit change column widths, so that does not
+        # re-measure all rows for every column (see onSectionResized)
+        self.adjustingColumns = False
+
+        # Zoom: Ctrl++ / Ctrl+- / Ctrl+0 and Ctrl+mouse wheel over the table
+        for shortcut, slot in [(QKeySequence.ZoomIn, lambda: self.setZoom(self.zoomFactor * ZOOM_STEP)),
+                               ("Ctrl+=", lambda: self.setZoom(self.zoomFactor * ZOOM_STEP)),
+                               (QKeySequence.ZoomOut, lambda: self.setZoom(self.zoomFactor / ZOOM_STEP)),
+                               ("Ctrl+0", lambda: self.setZoom(1.0))]:
+            zoomAction = QAction(self)
+            zoomAction.setShortcut(QKeySequence(shortcut))
+            zoomAction.triggered.connect(slot)
+            self.addAction(zoomAction)
+        self.table.viewport().installEventFilter(self)
+
+        # While scrolling fast the delegate draws plain text; once the view has
+        # settled for a moment the rich version is drawn again
+        self.lastScrollValue = 0
+        self.scrollSettleTimer = QTimer(self)
+        self.scrollSettleTimer.setSingleShot(True)
+        self.scrollSettleTimer.setInterval(150)
+        self.scrollSettleTimer.timeout.connect(self.onScrollSettled)
+        self.table.verticalScrollBar().valueChanged.connect(self.onTableScrolled)
+
+        # Rows still to be measured by the idle-time column auto-fit refinement
+        self.autoFitRows = []
+        self.autoFitTimer = QTimer(self)
+        self.autoFitTimer.setInterval(0)
+        self.autoFitTimer.timeout.connect(self.refineColumnWidths)
         btnExportCSV.clicked.connect(self.exportCSV)
         btnImportCSV.clicked.connect(self.importCSV)
+        btnExportXLSX.clicked.connect(self.exportXLSX)
         btnSaveProj.clicked.connect(self.saveProject)
         btnLoadProj.clicked.connect(self.loadProject)
+        btnImportBib.clicked.connect(self.importBibliography)
+        btnMergeProj.clicked.connect(self.mergeProjects)
+        btnCompareProj.clicked.connect(self.compareProject)
         btnCF.clicked.connect(self.openCFDialog)
         btnAdvFilter.clicked.connect(self.advancedFilter)
+        btnFind.clicked.connect(self.openFindDialog)
+        btnStats.clicked.connect(self.openStatsDialog)
+        findAction = QAction("Find/Replace", self)
+        findAction.setShortcut("Ctrl+F")
+        findAction.triggered.connect(self.openFindDialog)
+        self.addAction(findAction)
         btnCollapse.clicked.connect(self.toggleCollapseRow)
+        btnCollapseAll.clicked.connect(lambda: self.setAllRowsCollapsed(True))
+        btnExpandAll.clicked.connect(lambda: self.setAllRowsCollapsed(False))
         btnPrint.clicked.connect(self.printTable)
 
         # Status Bar
@@ -452,6 +1850,199 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
 
+    def eventFilter(self, obj, event):
+        if obj is self.table.viewport() and event.type() == QEvent.Wheel \
+                and event.modifiers() & Qt.ControlModifier:
+            step = ZOOM_STEP if event.angleDelta().y() > 0 else 1 / ZOOM_STEP
+            self.setZoom(self.zoomFactor * step)
+            return True
+        if obj is self.table and event.type() == QEvent.KeyPress:
+            if event.matches(QKeySequence.Copy):
+                self.copySelection()
+                return True
+            if event.matches(QKeySequence.Paste):
+                self.pasteClipboard()
+                return True
+        return super().eventFilter(obj, event)
+
+    def copySelection(self):
+        """Copies the selected cells (in visual column order, skipping hidden
+        rows/columns) as tab-separated plain text and as an HTML table."""
+        indexes = self.table.selectedIndexes()
+        if not indexes:
+            return
+        headerView = self.table.horizontalHeader()
+        selected = {(index.row(), index.column()) for index in indexes}
+        rows = sorted({row for row, _ in selected if not self.table.isRowHidden(row)})
+        cols = sorted({col for _, col in selected if not self.table.isColumnHidden(col)},
+                      key=headerView.visualIndex)
+
+        tsv = io.StringIO()
+        writer = csv.writer(tsv, delimiter="\t", lineterminator="\n")
+        htmlRows = []
+        for row in rows:
+            plainCells, htmlCells = [], []
+            for col in cols:
+                item = self.table.item(row, col) if (row, col) in selected else None
+                cellHtml = item.text() if item is not None else ""
+                plainCells.append(htmlPlainText(cellHtml))  # csv.writer quotes multi-line cells
+                htmlCells.append(f"<td>{htmlBodyFragment(cellHtml)}</td>")
+            writer.writerow(plainCells)
+            htmlRows.append("<tr>" + "".join(htmlCells) + "</tr>")
+
+        mimeData = QMimeData()
+        mimeData.setText(tsv.getvalue())
+        mimeData.setHtml("<html><body><table>" + "".join(htmlRows) + "</table></body></html>")
+        QApplication.clipboard().setMimeData(mimeData)
+        self.statusBar.showMessage(f"Copied {len(rows)} x {len(cols)} cells", 3000)
+
+    def pasteClipboard(self):
+        """Pastes tab-separated text at the current cell, adding rows and
+        columns as needed, as one batched update."""
+        text = QApplication.clipboard().text()
+        if not text:
+            return
+        data = list(csv.reader(io.StringIO(text), delimiter="\t"))
+        if not data:
+            return
+        width = max(len(rowData) for rowData in data)
+        headerView = self.table.horizontalHeader()
+        startRow = max(self.table.currentRow(), 0)
+        startVisual = headerView.visualIndex(self.table.currentColumn()) if self.table.currentColumn() >= 0 else 0
+
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        blocker = QSignalBlocker(self.table)  # no cellChanged -> no row resize per cell
+        try:
+            if startRow + len(data) > self.table.rowCount():
+                self.table.setRowCount(startRow + len(data))
+            for col in range(self.table.columnCount(), startVisual + width):
+                self.table.insertColumn(col)
+                newHeader = f"Column {col + 1}"
+                self.table.setHorizontalHeaderItem(col, QTableWidgetItem(newHeader))
+                self.headers.append(newHeader)
+            # Pasted columns follow the visual column order, like copySelection
+            targetCols = [headerView.logicalIndex(startVisual + j) for j in range(width)]
+            pastedItems = []  # one item per pasted row, to find the rows again after sorting
+            for i, rowData in enumerate(data):
+                row = startRow + i
+                for col, value in zip(targetCols, rowData):
+                    cellHtml = plainToCellHtml(value)
+                    item = self.table.item(row, col)
+                    if item is None:
+                        item = QTableWidgetItem(cellHtml)
+                        self.table.setItem(row, col, item)
+                    else:
+                        item.setText(cellHtml)
+                if rowData:
+                    pastedItems.append(item)
+        finally:
+            blocker.unblock()
+            self.table.setSortingEnabled(sorting)
+        for row in {self.table.row(item) for item in pastedItems}:
+            self.table.resizeRowToContents(row)
+        self.columnsButton.setMenu(self.createColumnsMenu())
+        self.statusBar.showMessage(f"Pasted {len(data)} x {width} cells", 3000)
+
+    def autoFitColumns(self):
+        """Sizes the columns from a bounded sample of rows instead of letting
+        resizeColumnsToContents() lay out every cell, then keeps refining the
+        widths with more rows while the application is idle."""
+        rowCount = self.table.rowCount()
+        sampleRows = set(range(min(AUTOFIT_FIRST_ROWS, rowCount)))
+        sampleRows.update(random.sample(range(rowCount), min(AUTOFIT_RANDOM_ROWS, rowCount)))
+        for col in range(self.table.columnCount()):
+            # Longest values by text length; only len() is taken for every row
+            lengths = ((len(item.text()), row) for row, item in
+                       ((row, self.table.item(row, col)) for row in range(rowCount)) if item is not None)
+            longestRows = [row for _, row in heapq.nlargest(AUTOFIT_LONGEST_ROWS, lengths)]
+            self.fitColumn(col, sampleRows.union(longestRows), shrink=True)
+
+        remaining = [row for row in range(rowCount) if row not in sampleRows]
+        self.autoFitRows = random.sample(remaining, min(AUTOFIT_REFINE_ROWS, len(remaining)))
+        if self.autoFitRows:
+            self.autoFitTimer.start()
+
+    def fitColumn(self, col, rows, shrink=False):
+        headerItem = self.table.horizontalHeaderItem(col)
+        headerText = headerItem.text() if headerItem is not None else ""
+        width = QFontMetrics(self.table.horizontalHeader().font()).horizontalAdvance(headerText) + 24
+        for row in rows:
+            item = self.table.item(row, col)
+            if item is not None and item.text():
+                width = max(width, self.delegate.contentWidth(item.text()) * self.zoomFactor)
+        width = min(round(width), round(AUTOFIT_MAX_WIDTH * self.zoomFactor))
+        if shrink or width > self.table.columnWidth(col):
+            self.adjustingColumns = True
+            try:
+                self.table.setColumnWidth(col, width)
+            finally:
+                self.adjustingColumns = False
+
+    def refineColumnWidths(self):
+        chunk = self.autoFitRows[-AUTOFIT_REFINE_CHUNK:]
+        del self.autoFitRows[-AUTOFIT_REFINE_CHUNK:]
+        rows = [row for row in chunk if row < self.table.rowCount()]
+        # Columns only grow here; rows measured earlier keep fitting, just
+        # with some spare height, so they are not re-measured
+        for col in range(self.table.columnCount()):
+            self.fitColumn(col, rows)
+        if not self.autoFitRows:
+            self.autoFitTimer.stop()
+
+    def onSectionResized(self, idx, old, new):
+        if not self.adjustingColumns:
+            self.table.resizeRowsToContents()
+
+    def setZoom(self, factor):
+        """Scales column widths, row heights and the delegate's painter. The
+        cells keep their (cached) layout, so no row has to be re-measured.
+        Each section gets its unzoomed size times the new zoom, and the
+        headers' minimum sizes scale along, so zooming is reversible."""
+        factor = min(max(factor, MIN_ZOOM), MAX_ZOOM)
+        oldFactor = self.zoomFactor
+        if abs(factor / oldFactor - 1.0) < 1e-6:
+            return
+        self.zoomFactor = factor
+        self.delegate.zoomFactor = factor
+        headers = (self.table.horizontalHeader(), self.table.verticalHeader())
+        self.adjustingColumns = True
+        blocker = QSignalBlocker(self.table.model())
+        try:
+            for header, baseSizes, baseMinimum in zip(headers, self.zoomBaseSizes, self.baseMinimumSectionSizes):
+                # No clamping while resizing; the scaled minimum is set afterwards
+                header.setMinimumSectionSize(1)
+                for section in range(header.count()):
+                    # Hidden sections report size 0; resizing would keep it
+                    if header.isSectionHidden(section):
+                        continue
+                    size = header.sectionSize(section)
+                    zoomedSize, baseSize = baseSizes.get(section, (None, None))
+                    if size != zoomedSize:
+                        # Resized since the last zoom (or never zoomed)
+                        baseSize = size / oldFactor
+                    size = max(1, round(baseSize * factor))
+                    header.resizeSection(section, size)
+                    baseSizes[section] = (size, baseSize)
+                header.setMinimumSectionSize(max(1, round(baseMinimum * factor)))
+        finally:
+            blocker.unblock()
+            self.adjustingColumns = False
+        self.table.viewport().update()
+        self.statusBar.showMessage(f"Zoom: {round(factor * 100)}%", 2000)
+
+    def onTableScrolled(self, value):
+        scrollBar = self.table.verticalScrollBar()
+        if scrollBar.isSliderDown() or abs(value - self.lastScrollValue) >= scrollBar.pageStep():
+            self.delegate.fastScrolling = True
+        self.lastScrollValue = value
+        if self.delegate.fastScrolling:
+            self.scrollSettleTimer.start()
+
+    def onScrollSettled(self):
+        self.delegate.fastScrolling = False
+        self.table.viewport().update()
+
     def edit_cell(self, row, col):
         item = self.table.item(row, col)
         if item is None:
@@ -557,6 +2148,35 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Export CSV", f"Error exporting CSV:\n{e}")
 
+    def exportXLSX(self):
+        filePath, _ = QFileDialog.getSaveFileName(self, "Export XLSX", "", "Excel Files (*.xlsx)")
+        if not filePath:
+            return
+        if not filePath.lower().endswith(".xlsx"):
+            filePath += ".xlsx"
+
+        try:
+            # Columns in the order and with the widths shown in the header view
+            headerView = self.table.horizontalHeader()
+            columns = [headerView.logicalIndex(vis) for vis in range(self.table.columnCount())]
+            tableHeaders = self.tableHeaders()
+            headers = [tableHeaders[col] for col in columns]
+            widths = [self.table.columnWidth(col) / self.zoomFactor for col in columns]
+            hidden = {pos for pos, col in enumerate(columns) if self.table.isColumnHidden(col)}
+
+            def rowsInColumnOrder():
+                for row in range(self.table.rowCount()):
+                    rowData = []
+                    for col in columns:
+                        item = self.table.item(row, col)
+                        rowData.append(item.text() if item is not None else "")
+                    yield rowData
+
+            writeXlsxWorkbook(filePath, headers, widths, rowsInColumnOrder(), hidden)
+            self.statusBar.showMessage("Export successful!", 3000)
+        except Exception as e:
+            QMessageBox.warning(self, "Export XLSX", f"Error exporting XLSX:\n{e}")
+
     def importCSV(self):
         filePath, _ = QFileDialog.getOpenFileName(self, "Import CSV", "", "CSV Files (*.csv)")
         if not filePath:
@@ -571,7 +2191,6 @@ class MainWindow(QMainWindow):
             # CSV-Reader always with ";" as delimiter and '"' as Quotechar.
             reader = csv.reader(file_io, delimiter=";", quotechar='"')
             rows = list(reader)
-            print("DEBUG: CSV rows =", rows)  # Debug
 
             if not rows:
                 QMessageBox.warning(self, "Import CSV", "CSV file is empty!")
@@ -585,6 +2204,7 @@ class MainWindow(QMainWindow):
 
             # Tabelle komplett neu aufbauen:
             self.table.clear()
+            self.resetRowCollapsing()
             self.table.setColumnCount(len(headers))
             self.table.setHorizontalHeaderLabels(headers)
             self.table.setRowCount(len(data))
@@ -593,8 +2213,8 @@ class MainWindow(QMainWindow):
                 for j, cell in enumerate(row):
                     self.table.setItem(i, j, QTableWidgetItem(cell))
 
+            self.autoFitColumns()
             self.table.resizeRowsToContents()
-            self.table.resizeColumnsToContents()
             self.table.update()
             self.statusBar.showMessage("CSV import successful!", 3000)
 
@@ -604,6 +2224,184 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Import CSV", f"Error importing CSV:\n{e}")
 
+    def tableHeaders(self):
+        headers = []
+        for i in range(self.table.columnCount()):
+            header_item = self.table.horizontalHeaderItem(i)
+            headers.append(header_item.text() if header_item is not None else "")
+        return headers
+
+    def importBibliography(self):
+        if self.importWorker is not None:
+            QMessageBox.warning(self, "Import BibTeX/RIS", "An import is already running!")
+            return
+        filePath, _ = QFileDialog.getOpenFileName(
+            self, "Import BibTeX/RIS", "", "Bibliography Files (*.bib *.ris);;BibTeX Files (*.bib);;RIS Files (*.ris)")
+        if not filePath:
+            return
+
+        fileFormat = "ris" if filePath.lower().endswith(".ris") else "bib"
+        # Entries are appended to the current table; columns are matched by header name
+        self.importColumns = {name: col for col, name in enumerate(self.tableHeaders())}
+        self.importedCount = 0
+        self.importSorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+
+        self.importWorker = BibImportWorker(filePath, fileFormat, parent=self)
+        self.importWorker.batchReady.connect(self.appendImportBatch)
+        self.importWorker.failed.connect(
+            lambda msg: QMessageBox.warning(self, "Import BibTeX/RIS", f"Error importing file:\n{msg}"))
+        self.importWorker.finished.connect(self.finishBibliographyImport)
+        self.importWorker.start()
+        self.statusBar.showMessage("Importing bibliography...")
+
+    def appendImportBatch(self, entries):
+        blocker = QSignalBlocker(self.table)  # no cellChanged -> no full row resize per cell
+        try:
+            firstRow = self.table.rowCount()
+            self.table.setRowCount(firstRow + len(entries))
+            for offset, entry in enumerate(entries):
+                row = firstRow + offset
+                for name, value in entry.items():
+                    col = self.importColumns.get(name)
+                    if col is None:
+                        col = self.table.columnCount()
+                        self.table.insertColumn(col)
+                        self.table.setHorizontalHeaderItem(col, QTableWidgetItem(name))
+                        self.headers.append(name)
+                        self.importColumns[name] = col
+                    self.table.setItem(row, col, QTableWidgetItem(html.escape(value, quote=False)))
+            for row in range(firstRow, self.table.rowCount()):
+                self.table.resizeRowToContents(row)
+        finally:
+            blocker.unblock()
+            self.importWorker.batchDone()
+        self.importedCount += len(entries)
+        self.statusBar.showMessage(f"Importing bibliography... {self.importedCount} entries")
+
+    def finishBibliographyImport(self):
+        self.importWorker.deleteLater()
+        self.importWorker = None
+        self.table.setSortingEnabled(self.importSorting)
+        self.columnsButton.setMenu(self.createColumnsMenu())
+        self.statusBar.showMessage(f"Imported {self.importedCount} entries!", 3000)
+
+    def mergeProjects(self):
+        if self.mergeWorker is not None:
+            QMessageBox.warning(self, "Merge Projects", "A merge is already running!")
+            return
+        filePaths, _ = QFileDialog.getOpenFileNames(
+            self, "Merge Projects", "", "Project/CSV Files (*.json *.json.gz *.csv);;Project Files (*.json *.json.gz);;CSV Files (*.csv)")
+        if not filePaths:
+            return
+        self.mergeWorker = ProjectMergeWorker(filePaths, self.tableHeaders(), parent=self)
+        self.mergeWorker.merged.connect(self.insertMergedRows)
+        self.mergeWorker.failed.connect(
+            lambda msg: QMessageBox.warning(self, "Merge Projects", f"Error merging projects:\n{msg}"))
+        self.mergeWorker.finished.connect(self.finishMergeProjects)
+        self.mergeWorker.start()
+        self.statusBar.showMessage(f"Merging {len(filePaths)} files...")
+
+    def insertMergedRows(self, headers, rows, rules):
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        blocker = QSignalBlocker(self.table)
+        try:
+            for col in range(self.table.columnCount(), len(headers)):
+                self.table.insertColumn(col)
+                self.table.setHorizontalHeaderItem(col, QTableWidgetItem(headers[col]))
+                self.headers.append(headers[col])
+            firstRow = self.table.rowCount()
+            self.table.setRowCount(firstRow + len(rows))
+            for offset, rowData in enumerate(rows):
+                for col, cell in enumerate(rowData):
+                    if cell:
+                        self.table.setItem(firstRow + offset, col, QTableWidgetItem(cell))
+            for word, color in rules.items():
+                self.delegate.rules.setdefault(word, color)
+        finally:
+            blocker.unblock()
+            self.table.setSortingEnabled(sorting)
+        self.table.resizeRowsToContents()
+        self.columnsButton.setMenu(self.createColumnsMenu())
+        self.statusBar.showMessage(f"Merged {len(rows)} rows!", 3000)
+
+    def finishMergeProjects(self):
+        self.mergeWorker.deleteLater()
+        self.mergeWorker = None
+
+    def compareProject(self):
+        filePath, _ = QFileDialog.getOpenFileName(
+            self, "Compare Projects", "autosave_project.json",
+            "Project/CSV Files (*.json *.json.gz *.csv);;All Files (*)")
+        if not filePath:
+            return
+        try:
+            otherHeaders, otherRows, _ = readTableFile(filePath)
+        except Exception as e:
+            QMessageBox.warning(self, "Compare Projects", f"Error reading file:\n{e}")
+            return
+        # CSV cells are plain text while the table holds HTML: compare the
+        # visible text only, so formatting alone does not count as a change
+        cellKey = None
+        if filePath.lower().endswith(".csv"):
+            otherRows = [[plainToCellHtml(cell) for cell in rowData] for rowData in otherRows]
+            cellKey = htmlComparableText
+        snapshot = self.projectSnapshot(includeLayout=False)
+        headers, rows, otherRows, changes = diffTableRows(
+            snapshot["headers"], snapshot["rows"], otherHeaders, otherRows, cellKey)
+        if not changes:
+            QMessageBox.information(self, "Compare Projects", "No differences found.")
+            return
+        # The dialog is modal, so the row indices stay valid until applied
+        dlg = ProjectDiffDialog(headers, rows, otherRows, changes, cellKey, self)
+        if dlg.exec_():
+            self.applyDiffChanges(headers, otherRows, dlg.getSelectedChanges(), cellKey)
+
+    def applyDiffChanges(self, headers, otherRows, changes, cellKey=None):
+        if not changes:
+            return
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        blocker = QSignalBlocker(self.table)
+        try:
+            for col in range(self.table.columnCount(), len(headers)):
+                self.table.insertColumn(col)
+                self.table.setHorizontalHeaderItem(col, QTableWidgetItem(headers[col]))
+                self.headers.append(headers[col])
+
+            key = cellKey or (lambda cell: cell)
+
+            def setRow(row, rowData):
+                # Cells that compare equal keep their text (and formatting)
+                for col, cell in enumerate(rowData):
+                    item = self.table.item(row, col)
+                    if item is None:
+                        if cell:
+                            self.table.setItem(row, col, QTableWidgetItem(cell))
+                    elif key(item.text()) != key(cell):
+                        item.setText(cell)
+
+            # Modify first, then remove from the bottom up, then append, so
+            # the snapshot row indices stay valid throughout
+            for kind, row, otherRow in changes:
+                if kind == "modified":
+                    setRow(row, otherRows[otherRow])
+                    self.table.resizeRowToContents(row)
+            for row in sorted((row for kind, row, _ in changes if kind == "removed"), reverse=True):
+                self.table.removeRow(row)
+            added = [otherRow for kind, _, otherRow in changes if kind == "added"]
+            firstRow = self.table.rowCount()
+            self.table.setRowCount(firstRow + len(added))
+            for offset, otherRow in enumerate(added):
+                setRow(firstRow + offset, otherRows[otherRow])
+                self.table.resizeRowToContents(firstRow + offset)
+        finally:
+            blocker.unblock()
+            self.table.setSortingEnabled(sorting)
+        self.columnsButton.setMenu(self.createColumnsMenu())
+        self.statusBar.showMessage(f"Applied {len(changes)} changes!", 3000)
+
     def openCFDialog(self):
         dlg = ConditionalFormattingDialog(self.delegate.rules, self)
         if dlg.exec_():
@@ -611,6 +2409,20 @@ class MainWindow(QMainWindow):
             self.delegate.rules = new_rules
             self.table.viewport().update()
 
+    def openFindDialog(self):
+        if self.findDialog is None:
+            self.findDialog = FindReplaceDialog(self.table, self)
+        self.findDialog.show()
+        self.findDialog.raise_()
+        self.findDialog.activateWindow()
+
+    def openStatsDialog(self):
+        if self.statsDialog is None:
+            self.statsDialog = StatisticsDialog(self.table, self)
+        self.statsDialog.show()
+        self.statsDialog.raise_()
+        self.statsDialog.activateWindow()
+
     def advancedFilter(self):
         currentHeaders = [self.table.horizontalHeaderItem(i).text()
                           if self.table.horizontalHeaderItem(i) else f"Column {i + 1}"
@@ -659,28 +2471,86 @@ class MainWindow(QMainWindow):
                 # Zeile entsprechend der Auswertung anzeigen oder verbergen
                 self.table.setRowHidden(row, not rowVisible)
 
+            # Statistics only cover the visible rows
+            if self.statsDialog is not None:
+                self.statsDialog.scheduleRecompute()
+
     def toggleCollapseRow(self):
         row = self.table.currentRow()
         if row < 0:
             QMessageBox.warning(self, "Toggle Collapse Row", "Please select a row!", parent=self)
             return
-        if row in self.collapsedRows:
-            originalHeight, originalContent = self.collapsedRows.pop(row)
-            self.table.setSpan(row, 0, 1, 1)
-            for col, text in enumerate(originalContent):
-                self.table.setItem(row, col, QTableWidgetItem(text))
-            self.table.setRowHeight(row, originalHeight)
+        collapse = not self.delegate.isCollapsed(self.table.model().index(row, 0))
+        self.setRowCollapsed(row, collapse)
+
+    def setRowCollapsed(self, row, collapse):
+        """Overrides the table-wide collapse state for one row. The flag is kept
+        on the row's first item; the delegate draws the preview."""
+        if self.table.columnCount() == 0:
+            return
+        item = self.table.item(row, 0)
+        # Inserting an item into the sort column would move its row, so pause
+        # sorting in that case. Blocking the model also skips the re-sort.
+        sorting = self.table.isSortingEnabled()
+        pauseSorting = item is None and sorting and self.table.horizontalHeader().sortIndicatorSection() == 0
+        if pauseSorting:
+            self.table.setSortingEnabled(False)
+        blocker = QSignalBlocker(self.table.model())
+        try:
+            if item is None:
+                item = QTableWidgetItem("")
+                self.table.setItem(row, 0, item)
+            item.setData(COLLAPSED_ROLE, (self.delegate.collapseEpoch, collapse))
+        finally:
+            blocker.unblock()
+            if pauseSorting:
+                self.table.setSortingEnabled(True)
+        row = self.table.row(item)
+        if collapse:
+            self.table.setRowHeight(row, self.delegate.collapsedHeight())
+            self.collapsedRows.append(QPersistentModelIndex(self.table.model().index(row, 0)))
         else:
-            originalHeight = self.table.rowHeight(row)
-            originalContent = []
-            for col in range(self.table.columnCount()):
-                item = self.table.item(row, col)
-                originalContent.append(item.text() if item else "")
-            self.collapsedRows[row] = (originalHeight, originalContent)
-            mergedText = originalContent[0]
-            self.table.setSpan(row, 0, 1, self.table.columnCount())
-            self.table.setItem(row, 0, QTableWidgetItem(mergedText))
-            self.table.setRowHeight(row, 20)
+            self.table.resizeRowToContents(row)
+        self.table.viewport().update()
+
+    def setAllRowsCollapsed(self, collapse):
+        """Collapses or expands every row without touching the items: the
+        delegate's table-wide flag decides, a new epoch makes the per-row
+        overrides stale, and the heights change in one header operation."""
+        header = self.table.verticalHeader()
+        self.delegate.collapseEpoch += 1
+        rows = [index.row() for index in self.collapsedRows if index.isValid()]
+        self.collapsedRows = []
+        if not self.delegate.allCollapsed:
+            # Rows collapsed one by one are expanded now, so the saved header
+            # state holds their content heights.
+            for row in rows:
+                self.table.resizeRowToContents(row)
+            if collapse:
+                self.expandedRowsState = (self.table.rowCount(), self.zoomFactor,
+                                          header.defaultSectionSize(), header.saveState())
+        self.delegate.allCollapsed = collapse
+        if collapse:
+            header.setDefaultSectionSize(self.delegate.collapsedHeight())
+        elif self.expandedRowsState is not None:
+            rowCount, zoom, defaultHeight, state = self.expandedRowsState
+            self.expandedRowsState = None
+            # Rows were added or removed or the zoom changed meanwhile:
+            # measure them instead.
+            if (rowCount != self.table.rowCount() or zoom != self.zoomFactor
+                    or not header.restoreState(state)):
+                header.setDefaultSectionSize(defaultHeight)
+                self.table.resizeRowsToContents()
+        self.table.viewport().update()
+
+    def resetRowCollapsing(self):
+        """Expands all rows before the table is refilled."""
+        if self.expandedRowsState is not None:
+            self.table.verticalHeader().setDefaultSectionSize(self.expandedRowsState[2])
+        self.delegate.allCollapsed = False
+        self.delegate.collapseEpoch += 1
+        self.collapsedRows = []
+        self.expandedRowsState = None
 
     def createColumnsMenu(self):
         """Erstellt ein QMenu mit checkbaren Aktionen für jede Spalte."""
@@ -745,59 +2615,69 @@ class MainWindow(QMainWindow):
         doc.print_(printer)
 
     def saveProject(self):
-        filePath, _ = QFileDialog.getSaveFileName(self, "Save Project", "", "Project Files (*.json)")
+        filePath, selectedFilter = QFileDialog.getSaveFileName(
+            self, "Save Project", "", "Project Files (*.json);;Compressed Project Files (*.json.gz)")
         if not filePath:
             return
-        try:
-            # Ermittele die aktuellen Header direkt aus der Tabelle.
-            headers = []
-            for i in range(self.table.columnCount()):
-                header_item = self.table.horizontalHeaderItem(i)
-                headers.append(header_item.text() if header_item is not None else "")
-
-            # Erstelle eine Liste aller Zeilen, wobei jede Zeile eine Liste der Zelltexte ist.
-            rows_data = []
-            for row in range(self.table.rowCount()):
-                row_data = []
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    row_data.append(item.text() if item is not None else "")
-                rows_data.append(row_data)
-
-            # Spaltenbreiten erfassen:
-            colWidths = []
-            for col in range(self.table.columnCount()):
-                colWidths.append(self.table.columnWidth(col))
-
-            # Spaltenreihenfolge erfassen:
-            columnOrder = []
+        if selectedFilter.startswith("Compressed") and not filePath.lower().endswith(".gz"):
+            filePath += ".gz"
+        self.startProjectSave(filePath, self.projectSnapshot(), "Project saved successfully!")
+
+    def projectSnapshot(self, includeLayout=True):
+        """Collects the table contents on the GUI thread. Only plain Python
+        strings/lists are returned, so the worker never touches Qt items."""
+        columnCount = self.table.columnCount()
+        item = self.table.item
+        rows_data = []
+        for row in range(self.table.rowCount()):
+            row_data = []
+            for col in range(columnCount):
+                cell = item(row, col)
+                row_data.append(cell.text() if cell is not None else "")
+            rows_data.append(row_data)
+
+        projectData = {
+            "headers": self.tableHeaders(),
+            "rows": rows_data,
+            "rules": dict(self.delegate.rules)
+        }
+        if includeLayout:
             headerView = self.table.horizontalHeader()
-            for vis in range(self.table.columnCount()):
-                logical = headerView.logicalIndex(vis)
-                columnOrder.append(logical)
-
-            projectData = {
-                "headers": headers,
-                "rows": rows_data,
-                "columnWidths": colWidths,
-                "columnOrder": columnOrder,
-                "rules": self.delegate.rules
-            }
-
-            with open(filePath, "w", encoding="utf-8") as f:
-                json.dump(projectData, f, indent=2)
-
-            self.statusBar.showMessage("Project saved successfully!", 3000)
-        except Exception as e:
-            QMessageBox.warning(self, "Save Project", f"Error saving project:\n{e}")
+            projectData["columnWidths"] = [round(self.table.columnWidth(col) / self.zoomFactor)
+                                           for col in range(columnCount)]
+            projectData["columnOrder"] = [headerView.logicalIndex(vis) for vis in range(columnCount)]
+        return projectData
+
+    def startProjectSave(self, filePath, projectData, successMessage, autoSave=False):
+        # One save per file at a time, so an older snapshot can never finish
+        # after (and overwrite) a newer one; only the newest waiting one is kept
+        key = os.path.abspath(filePath)
+        if key in self.saveWorkers:
+            self.pendingSaves[key] = (filePath, projectData, successMessage, autoSave)
+            return
+        worker = ProjectSaveWorker(filePath, projectData, parent=self)
+        worker.saved.connect(lambda path: self.statusBar.showMessage(successMessage, 3000))
+        if autoSave:
+            worker.failed.connect(lambda msg: self.statusBar.showMessage(f"Auto-save failed: {msg}", 2000))
+        else:
+            worker.failed.connect(
+                lambda msg: QMessageBox.warning(self, "Save Project", f"Error saving project:\n{msg}"))
+        worker.finished.connect(lambda: self.finishProjectSave(key))
+        self.saveWorkers[key] = worker
+        worker.start()
+
+    def finishProjectSave(self, key):
+        self.saveWorkers.pop(key).deleteLater()
+        if key in self.pendingSaves:
+            self.startProjectSave(*self.pendingSaves.pop(key))
 
     def loadProject(self):
-        filePath, _ = QFileDialog.getOpenFileName(self, "Load Project", "", "Project Files (*.json)")
+        filePath, _ = QFileDialog.getOpenFileName(
+            self, "Load Project", "", "Project Files (*.json *.json.gz);;All Files (*)")
         if not filePath:
             return
         try:
-            with open(filePath, "r", encoding="utf-8") as f:
-                projectData = json.load(f)
+            projectData = readProjectData(filePath)
 
             # Get headers and row data from the JSON file.
             headers = projectData.get("headers", [])
@@ -807,6 +2687,7 @@ class MainWindow(QMainWindow):
             # Completely clear the table: set both row and column count to zero.
             self.table.setRowCount(0)
             self.table.setColumnCount(0)
+            self.resetRowCollapsing()
 
             # Set the column count and header labels.
             self.table.setColumnCount(len(headers))
@@ -835,7 +2716,7 @@ class MainWindow(QMainWindow):
             colWidths = projectData.get("columnWidths", [])
             for col in range(len(headers)):
                 if col < len(colWidths):
-                    self.table.setColumnWidth(col, colWidths[col])
+                    self.table.setColumnWidth(col, round(colWidths[col] * self.zoomFactor))
 
             self.columnsButton.setMenu(self.createColumnsMenu())
 
@@ -843,33 +2724,27 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.warning(self, "Load Project", f"Error loading project:\n{e}")
 
+    def closeEvent(self, event):
+        # Let running and waiting saves finish so no project is lost; stop imports/merges
+        for worker in self.saveWorkers.values():
+            worker.wait()
+        for filePath, projectData, _, autoSave in self.pendingSaves.values():
+            try:
+                writeProjectData(filePath, projectData)
+            except Exception as e:
+                if not autoSave:
+                    QMessageBox.warning(self, "Save Project", f"Error saving project:\n{e}")
+        self.pendingSaves.clear()
+        for worker in (self.importWorker, self.mergeWorker):
+            if worker is not None:
+                worker.requestInterruption()
+                worker.wait()
+        super().closeEvent(event)
+
     def autoSave(self):
         try:
-            # Header direkt aus der Tabelle ermitteln
-            headers = []
-            for i in range(self.table.columnCount()):
-                headerItem = self.table.horizontalHeaderItem(i)
-                headers.append(headerItem.text() if headerItem is not None else "")
-
-            # Alle Zeilen aus der Tabelle auslesen
-            rows_data = []
-            for row in range(self.table.rowCount()):
-                row_data = []
-                for col in range(self.table.columnCount()):
-                    item = self.table.item(row, col)
-                    row_data.append(item.text() if item is not None else "")
-                rows_data.append(row_data)
-
-            projectData = {
-                "headers": headers,
-                "rows": rows_data,
-                "rules": self.delegate.rules
-            }
-
-            with open("autosave_project.json", "w", encoding="utf-8") as f:
-                json.dump(projectData, f, indent=2)
-
-            self.statusBar.showMessage("Auto-saved project!", 2000)
+            projectData = self.projectSnapshot(includeLayout=False)
+            self.startProjectSave("autosave_project.json", projectData, "Auto-saved project!", autoSave=True)
         except Exception as e:
             self.statusBar.showMessage(f"Auto-save failed: {e}", 2000)
 